@@ -3,15 +3,13 @@ import pandas as pd
 import os
 
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from pandas import DataFrame
-from typing import List
+from pandas import DataFrame, Series
 
 from data_processing.settings import configure_logging
 from data_processing.src.dateutil import (
-    is_one_week_diff,
-    is_one_month_diff,
-    is_one_year_diff,
+    is_one_week_diff_series,
+    is_one_month_diff_series,
+    is_one_year_diff_series,
 )
 from data_processing.src.helpers import print_time_duration
 
@@ -34,6 +32,30 @@ WEEKLY_INPUT_RATE_OUTPUT_FILENAME = 'input-rate-weekly'
 MONTHLY_INPUT_RATE_OUTPUT_FILENAME = 'input-rate-monthly'
 YEARLY_INPUT_RATE_OUTPUT_FILENAME = 'input-rate-yearly'
 
+IS_ONE_PERIOD_DIFF = {
+    'weekly': is_one_week_diff_series,
+    'monthly': is_one_month_diff_series,
+    'yearly': is_one_year_diff_series,
+}
+
+
+def _set_value_before_period(dataframe: DataFrame, previous: DataFrame, period_type: str) -> None:
+    """
+    Set the total active/inactive therapists before period started.
+
+    The total active/inactive therapists on the `previous` period are used
+    if it's exactly one `period_type` before, otherwise they're set to zero.
+    """
+    is_one_period_diff = IS_ONE_PERIOD_DIFF.get(period_type)
+
+    if is_one_period_diff:
+        is_consecutive = is_one_period_diff(previous['period_end'], dataframe['period_end'])
+    else:
+        is_consecutive = Series(False, index=dataframe.index)
+
+    dataframe['active_ther_b_period'] = previous['active_ther'].where(is_consecutive, 0).astype('Int64')
+    dataframe['inactive_ther_b_period'] = previous['inactive_ther'].where(is_consecutive, 0).astype('Int64')
+
 
 class OrgActiveTherProcessor:
 
@@ -46,85 +68,20 @@ class OrgActiveTherProcessor:
         Calculate total active/inactive therapists in the Organization
         before particular period is started and returns a copy of that `dataframe`.
         """
-        dataframes = self._split_dataframe_per_org(dataframe)
+        # Groups the rows per organization, in order of the organization's first appearance,
+        # while keeping the order of the periods within every organization.
+        org_order = Series(pd.factorize(dataframe['organization_id'])[0], index=dataframe.index)
+        dataframe = dataframe.loc[org_order.sort_values(kind='mergesort').index].reset_index(drop=True)
 
-        for df in dataframes:
-            self._set_value_before_period(df, period_type)
+        # The previous period of every row in the same organization
+        previous = dataframe.groupby('organization_id', sort=False)[
+            ['period_end', 'active_ther', 'inactive_ther']
+        ].shift(1)
 
-        # Merge all dataframes into a single dataframe
-        dataframe = pd.concat(dataframes).reset_index().drop(columns=['level_0', 'index'])
+        _set_value_before_period(dataframe, previous, period_type)
 
         return dataframe
 
-    def _split_dataframe_per_org(self, dataframe: DataFrame) -> List[DataFrame]:
-        """
-        Splits that `dataframe` per organization ID.
-        """
-        organization_ids = dataframe['organization_id'].drop_duplicates().array
-
-        # We use `.copy()` to avoid `SettingWithCopyWarning`.
-        # The warning arises because we make a subset of the main dataframe,
-        # but then we modify it immediately.
-        # The subset of the main dataframe is created using shallow copy.
-        # Therefore the warning tells us that the action might affecting the main
-        # dataframe and some inconsistency is expected to occur.
-        dataframes = [
-            dataframe[dataframe['organization_id'] == org_id].copy(deep=True).reset_index()
-            for org_id in organization_ids
-        ]
-
-        return dataframes
-
-    def _set_value_before_period(self, dataframe: DataFrame, period_type: str) -> None:
-        """
-        Set the total active/inactive therapists before period started.
-        """
-        for index, row in dataframe.iterrows():
-
-            if index == 0:
-                self._set_with_zero(index, dataframe)
-                continue
-
-            current_period_end = row['period_end']
-            prev_period_end = dataframe.loc[index - 1, ['period_end']]['period_end']
-
-            if period_type == 'weekly':
-                if is_one_week_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            elif period_type == 'monthly':
-                if is_one_month_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            elif period_type == 'yearly':
-                if is_one_year_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            self._set_with_zero(index, dataframe)
-
-    def _set_with_zero(self, index, dataframe) -> None:
-        """
-        Sets the total active/inactive therapists before period is started
-        on that current `index` of that `dataframe` to zero.
-        """
-        dataframe.loc[index, ['active_ther_b_period']] = [0]
-        dataframe.loc[index, ['inactive_ther_b_period']] = [0]
-
-    def _set_with_prev_row(self, index, dataframe) -> None:
-        """
-        Sets the total active/inactive therapists before period is started
-        on that current `index` of that `dataframe`
-        with the total active/inactive therapists on the previous period.
-        """
-        prev_active_ther = dataframe.loc[index - 1, ['active_ther']]['active_ther']
-        prev_inactive_ther = dataframe.loc[index - 1, ['inactive_ther']]['inactive_ther']
-
-        dataframe.loc[index, ['active_ther_b_period']] = [prev_active_ther]
-        dataframe.loc[index, ['inactive_ther_b_period']] = [prev_inactive_ther]
-
 
 class OrgWeeklyActiveTherProcessor(OrgActiveTherProcessor):
 
@@ -202,10 +159,7 @@ class OrgWeeklyActiveTherProcessor(OrgActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{ORG_DIR}/weekly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -294,10 +248,7 @@ class OrgMonthlyActiveTherProcessor(OrgActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{ORG_DIR}/monthly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -319,18 +270,16 @@ class OrgMonthlyActiveTherProcessor(OrgActiveTherProcessor):
         """
         Generates date period on that `dataframe`.
         """
-        # Generates `period_start` column
-        dataframe['period_start'] = dataframe.apply(lambda row: row['period'] + '-01', axis=1)
-
-        # Converts `period_start` column data type to a `datetime`
-        dataframe['period_start'] = dataframe[['period_start']].apply(pd.to_datetime, errors='coerce')
-
-        # Generates `period_end` column
-        dataframe['period_end'] = dataframe.apply(
-            lambda row: row['period_start'] + relativedelta(day=31),
-            axis=1
+        # Generates `period_start` column as a `datetime`
+        dataframe['period_start'] = pd.to_datetime(
+            dataframe['period'] + '-01',
+            format='%Y-%m-%d',
+            errors='coerce'
         )
 
+        # Generates `period_end` column by rolling the start forward to the end of its month
+        dataframe['period_end'] = dataframe['period_start'] + pd.offsets.MonthEnd(0)
+
         return dataframe
 
 
@@ -403,10 +352,7 @@ class OrgYearlyActiveTherProcessor(OrgActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{ORG_DIR}/yearly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -428,16 +374,17 @@ class OrgYearlyActiveTherProcessor(OrgActiveTherProcessor):
         """
         Generates date period on that `dataframe`.
         """
-        # Generates `period_start` column
-        dataframe['period_start'] = dataframe.apply(lambda row: row['period'] + '-01-01', axis=1)
-
-        # Converts `period_start` column data type to a `datetime`
-        dataframe['period_start'] = dataframe[['period_start']].apply(pd.to_datetime, errors='coerce')
-
-        # Generates `period_end` column
-        dataframe['period_end'] = dataframe.apply(
-            lambda row: row['period_start'] + relativedelta(day=31, month=12),
-            axis=1
+        # Generates `period_start` and `period_end` columns as a `datetime`,
+        # a year always starts on January 1st and ends on December 31st.
+        dataframe['period_start'] = pd.to_datetime(
+            dataframe['period'] + '-01-01',
+            format='%Y-%m-%d',
+            errors='coerce'
+        )
+        dataframe['period_end'] = pd.to_datetime(
+            dataframe['period'] + '-12-31',
+            format='%Y-%m-%d',
+            errors='coerce'
         )
 
         return dataframe
@@ -454,55 +401,13 @@ class NDActiveTherProcessor:
         Calculate total active/inactive therapists in NiceDay before particular period
         is started and returns a copy of that `dataframe`.
         """
+        # The previous period of every row
+        previous = dataframe[['period_end', 'active_ther', 'inactive_ther']].shift(1)
 
-        for index, row in dataframe.iterrows():
-
-            if index == 0:
-                self._set_with_zero(index, dataframe)
-                continue
-
-            current_period_end = row['period_end']
-            prev_period_end = dataframe.loc[index - 1, ['period_end']]['period_end']
-
-            if period_type == 'weekly':
-                if is_one_week_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            elif period_type == 'monthly':
-                if is_one_month_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            elif period_type == 'yearly':
-                if is_one_year_diff(prev_period_end, current_period_end):
-                    self._set_with_prev_row(index, dataframe)
-                    continue
-
-            self._set_with_zero(index, dataframe)
+        _set_value_before_period(dataframe, previous, period_type)
 
         return dataframe
 
-    def _set_with_zero(self, index, dataframe) -> None:
-        """
-        Sets the total active/inactive therapists before period is started
-        on that current `index` of that `dataframe` to zero.
-        """
-        dataframe.loc[index, ['active_ther_b_period']] = [0]
-        dataframe.loc[index, ['inactive_ther_b_period']] = [0]
-
-    def _set_with_prev_row(self, index, dataframe) -> None:
-        """
-        Sets the total active/inactive therapists before period is started
-        on that current `index` of that `dataframe`
-        with the total active/inactive therapists on the previous period.
-        """
-        prev_active_ther = dataframe.loc[index - 1, ['active_ther']]['active_ther']
-        prev_inactive_ther = dataframe.loc[index - 1, ['inactive_ther']]['inactive_ther']
-
-        dataframe.loc[index, ['active_ther_b_period']] = [prev_active_ther]
-        dataframe.loc[index, ['inactive_ther_b_period']] = [prev_inactive_ther]
-
 
 class NDWeeklyActiveTherProcessor(NDActiveTherProcessor):
 
@@ -578,10 +483,7 @@ class NDWeeklyActiveTherProcessor(NDActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{APP_DIR}/weekly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -667,10 +569,7 @@ class NDMonthlyActiveTherProcessor(NDActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{APP_DIR}/monthly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -691,18 +590,16 @@ class NDMonthlyActiveTherProcessor(NDActiveTherProcessor):
         """
         Generates date period on that `dataframe`.
         """
-        # Generates `period_start` column
-        dataframe['period_start'] = dataframe.apply(lambda row: row['period'] + '-01', axis=1)
-
-        # Converts `period_start` column data type to a `datetime`
-        dataframe['period_start'] = dataframe[['period_start']].apply(pd.to_datetime, errors='coerce')
-
-        # Generates `period_end` column
-        dataframe['period_end'] = dataframe.apply(
-            lambda row: row['period_start'] + relativedelta(day=31),
-            axis=1
+        # Generates `period_start` column as a `datetime`
+        dataframe['period_start'] = pd.to_datetime(
+            dataframe['period'] + '-01',
+            format='%Y-%m-%d',
+            errors='coerce'
         )
 
+        # Generates `period_end` column by rolling the start forward to the end of its month
+        dataframe['period_end'] = dataframe['period_start'] + pd.offsets.MonthEnd(0)
+
         return dataframe
 
 
@@ -773,10 +670,7 @@ class NDYearlyActiveTherProcessor(NDActiveTherProcessor):
         # * Create output directory if it doesn't exists
         output_path = f'{INPUT_RATE_OUTPUT_PATH}/{APP_DIR}/yearly'
 
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        os.makedirs(output_path, exist_ok=True)
 
         # * Export dataframe to CSV file
         dataframe[[
@@ -797,16 +691,17 @@ class NDYearlyActiveTherProcessor(NDActiveTherProcessor):
         """
         Generates date period on that `dataframe`.
         """
-        # Generates `period_start` column
-        dataframe['period_start'] = dataframe.apply(lambda row: row['period'] + '-01-01', axis=1)
-
-        # Converts `period_start` column data type to a `datetime`
-        dataframe['period_start'] = dataframe[['period_start']].apply(pd.to_datetime, errors='coerce')
-
-        # Generates `period_end` column
-        dataframe['period_end'] = dataframe.apply(
-            lambda row: row['period_start'] + relativedelta(day=31, month=12),
-            axis=1
+        # Generates `period_start` and `period_end` columns as a `datetime`,
+        # a year always starts on January 1st and ends on December 31st.
+        dataframe['period_start'] = pd.to_datetime(
+            dataframe['period'] + '-01-01',
+            format='%Y-%m-%d',
+            errors='coerce'
+        )
+        dataframe['period_end'] = pd.to_datetime(
+            dataframe['period'] + '-12-31',
+            format='%Y-%m-%d',
+            errors='coerce'
         )
 
         return dataframe
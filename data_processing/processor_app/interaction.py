@@ -111,6 +111,10 @@ class InteractionDataProcessor:
             all_time_thers=lambda _: head.iloc[0][1],
         )
 
+        # * Keeps the cleaned dataframe in memory,
+        # * so every export below doesn't have to read and clean the Interaction data again.
+        dataframe = dataframe.persist()
+
         # Step 5 - Generate period column
         # * Value of the `period` column is generated based on the `interaction_date`.
         logger.info("Generate 'period' column based on the period type and 'interaction_date'...")
@@ -188,10 +192,7 @@ class InteractionFileExport:
         # Check the period input directory availability
         path = f'{INPUT_INTERACTION_PATH}/alltime'
 
-        is_exists = os.path.exists(path)
-
-        if not is_exists:
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         # Slice dataframe into 10 partitions
         dataframe = dataframe.repartition(npartitions=10)
@@ -240,10 +241,7 @@ class InteractionFileExport:
         # Create the period input directory if it doesn't exists
         path = f'{INPUT_ORG_INTERACTION_PATH}/{period_type}'
 
-        is_exists = os.path.exists(path)
-
-        if not is_exists:
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         # Slice dataframe into 10 partitions
         dataframe = dataframe.repartition(npartitions=10)
@@ -269,10 +267,7 @@ class InteractionFileExport:
         # Create the period input directory if it doesn't exists
         path = f'{INPUT_APP_INTERACTION_PATH}/{period_type}'
 
-        is_exists = os.path.exists(path)
-
-        if not is_exists:
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
         # Slice dataframe into 10 partitions
         dataframe = dataframe.repartition(npartitions=10)
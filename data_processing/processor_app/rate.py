@@ -1,8 +1,14 @@
 import logging
+import multiprocessing
+import numpy as np
 import os
 import pandas as pd
+import sys
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pandas import DataFrame
+from typing import Dict, Tuple
 
 from data_processing.src.helpers import print_time_duration
 from data_processing.settings import configure_logging
@@ -26,46 +32,155 @@ WEEKLY_RATE_OUTPUT_FILENAME = 'output-weekly-rate'
 MONTHLY_RATE_OUTPUT_FILENAME = 'output-monthly-rate'
 YEARLY_RATE_OUTPUT_FILENAME = 'output-yearly-rate'
 
+# Number of rows that are loaded into memory at once while calculating the rates
+RATE_CHUNK_SIZE = 1_000_000
+
+# Schema of the rate input/output files
+ORG_RATE_INPUT_COLUMNS = (
+    'period_start',
+    'period_end',
+    'organization_id',
+    'active_ther',
+    'inactive_ther',
+    'total_ther',
+    'active_ther_b_period',
+    'inactive_ther_b_period'
+)
+ORG_RATE_INPUT_DTYPES = {
+    'period_start': 'str',
+    'period_end': 'str',
+    'organization_id': 'int64',
+    'active_ther': 'int64',
+    'inactive_ther': 'int64',
+    'total_ther': 'int64',
+    'active_ther_b_period': 'int64',
+    'inactive_ther_b_period': 'int64'
+}
+ORG_RATE_OUTPUT_COLUMNS = (
+    'period_start',
+    'period_end',
+    'organization_id',
+    'churn_rate',
+    'retention_rate',
+)
+
+APP_RATE_INPUT_COLUMNS = (
+    'period_start',
+    'period_end',
+    'active_ther',
+    'inactive_ther',
+    'total_ther',
+    'active_ther_b_period',
+    'inactive_ther_b_period'
+)
+APP_RATE_INPUT_DTYPES = {
+    'period_start': 'str',
+    'period_end': 'str',
+    'active_ther': 'int64',
+    'inactive_ther': 'int64',
+    'total_ther': 'int64',
+    'active_ther_b_period': 'int64',
+    'inactive_ther_b_period': 'int64'
+}
+APP_RATE_OUTPUT_COLUMNS = (
+    'period_start',
+    'period_end',
+    'churn_rate',
+    'retention_rate',
+)
+
 
 class ActiveTherapistRate:
 
-    def _get_churn_rate(
+    def _calculate_rates(
         self,
-        active_ther_b_period: int,
-        active_ther_w_period: int
-    ) -> float:
+        input_file: str,
+        names: Tuple[str, ...],
+        dtype: Dict[str, str],
+        output_columns: Tuple[str, ...],
+        path: str,
+        filename: str
+    ) -> None:
         """
-        Returns churn rate value.
+        Calculate rate of the active therapists from that `input_file`
+        and writes those `output_columns` into the `filename` CSV file
+        inside that `path` directory.
 
-        Params:
-        - `active_ther_b_period` : Total active therapists before period
-        - `active_ther_w_period` : Total active therapists within period
+        The rate of every row only depends on that row itself,
+        therefore we stream the `input_file` in chunks to keep the memory usage flat.
+
+        The `period_start` and `period_end` columns are passed through as they are,
+        so we read them as strings instead of parsing them into dates.
         """
-        if active_ther_b_period == 0:
-            return 0
+        # Create output directory if it doesn't exists
+        os.makedirs(path, exist_ok=True)
 
-        rate = (active_ther_b_period - active_ther_w_period) / active_ther_b_period
+        reader = pd.read_csv(
+            input_file,
+            sep=',',
+            names=names,
+            dtype=dtype,
+            chunksize=RATE_CHUNK_SIZE
+        )
 
-        return round(rate, 2)
+        with reader, open(f'{path}/{filename}.csv', 'w', newline='') as output_file:
+            for dataframe in reader:
+                dataframe = self._compute_rates(dataframe)
 
-    def _get_retention_rate(
-        self,
-        active_ther_b_period: int,
-        active_ther_w_period: int
-    ) -> float:
+                # We pass the `output_columns` to the writer instead of slicing the `dataframe`
+                # to avoid copying the whole chunk before it's exported.
+                dataframe.to_csv(
+                    output_file,
+                    columns=output_columns,
+                    index=False,
+                    header=False
+                )
+
+    def _compute_rates(self, dataframe: DataFrame) -> DataFrame:
         """
-        Returns retention rate value.
+        Generates the `churn_rate` and `retention_rate` columns on that `dataframe`.
 
-        Params:
+        Both rates are calculated from:
         - `active_ther_b_period` : Total active therapists before period
-        - `active_ther_w_period` : Total active therapists within period
+        - `active_ther` : Total active therapists within period
+
+        Both rates are zero if there is no active therapist before period.
         """
-        if active_ther_b_period == 0:
-            return 0
+        active_ther_b_period = dataframe['active_ther_b_period'].to_numpy(dtype=np.float64)
+        active_ther_w_period = dataframe['active_ther'].to_numpy(dtype=np.float64)
+
+        has_active_ther_b_period = active_ther_b_period != 0
+
+        # Calculates both rates into a single buffer,
+        # column 0 is the churn rate and column 1 is the retention rate.
+        rates = np.zeros((len(dataframe), 2), dtype=np.float64)
+
+        np.divide(
+            active_ther_b_period - active_ther_w_period,
+            active_ther_b_period,
+            out=rates[:, 0],
+            where=has_active_ther_b_period
+        )
+        np.divide(
+            active_ther_w_period,
+            active_ther_b_period,
+            out=rates[:, 1],
+            where=has_active_ther_b_period
+        )
+
+        # NumPy rounds `rate * 100` to the nearest integer, which differs from the built-in
+        # `round()` on the rates that sit right at the half (e.g. 0.975).
+        # Those few rates are rounded by the built-in `round()` to keep the results unchanged.
+        scaled_rates = rates * 100
+        is_half = np.isclose(scaled_rates - np.floor(scaled_rates), 0.5)
+        half_rates = rates[is_half]
+
+        np.round(rates, 2, out=rates)
+        rates[is_half] = [round(rate, 2) for rate in half_rates.tolist()]
 
-        rate = active_ther_w_period / active_ther_b_period
+        dataframe[['churn_rate', 'retention_rate']] = rates
 
-        return round(rate, 2)
+        return dataframe
 
 
 class OrgWeeklyActiveTherapistRate(ActiveTherapistRate):
@@ -87,73 +202,17 @@ class OrgWeeklyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists per Organization
         and writes the result into CSV file.
         """
-        logger.info("Load input of weekly active therapists per Organization from disk...")
-
-        # Step 1 - Load input of weekly active therapists
-        path = f'{INPUT_RATE_PATH}/{ORG_RATE_DIR}/weekly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'organization_id',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'organization_id': 'Int64',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
         logger.info("Calculating weekly rate of the active therapists per Organization...")
 
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/weekly'
-
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        path = f'{INPUT_RATE_PATH}/{ORG_RATE_DIR}/weekly'
 
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'organization_id',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{WEEKLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
+        self._calculate_rates(
+            input_file=f'{path}/{WEEKLY_RATE_INPUT_FILENAME}.csv',
+            names=ORG_RATE_INPUT_COLUMNS,
+            dtype=ORG_RATE_INPUT_DTYPES,
+            output_columns=ORG_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/weekly',
+            filename=WEEKLY_RATE_OUTPUT_FILENAME
         )
 
 
@@ -176,73 +235,17 @@ class OrgMonthlyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists per Organization
         and writes the result into CSV file.
         """
-        logger.info("Load input of monthly active therapists per Organization from disk...")
-
-        # Step 1 - Load input of monthly active therapists
-        path = f'{INPUT_RATE_PATH}/{ORG_RATE_DIR}/monthly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'organization_id',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'organization_id': 'Int64',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
         logger.info("Calculating monthly rate of the active therapists per Organization...")
 
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/monthly'
-
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        path = f'{INPUT_RATE_PATH}/{ORG_RATE_DIR}/monthly'
 
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'organization_id',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{MONTHLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
+        self._calculate_rates(
+            input_file=f'{path}/{MONTHLY_RATE_INPUT_FILENAME}.csv',
+            names=ORG_RATE_INPUT_COLUMNS,
+            dtype=ORG_RATE_INPUT_DTYPES,
+            output_columns=ORG_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/monthly',
+            filename=MONTHLY_RATE_OUTPUT_FILENAME
         )
 
 
@@ -265,73 +268,17 @@ class OrgYearlyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists per Organization
         and writes the result into CSV file.
         """
-        logger.info("Load input of yearly active therapists per Organization from disk...")
+        logger.info("Calculating yearly rate of the active therapists per Organization...")
 
-        # Step 1 - Load input of yearly active therapists
         path = f'{INPUT_RATE_PATH}/{ORG_RATE_DIR}/yearly'
 
-        dataframe = pd.read_csv(
-            f'{path}/{YEARLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'organization_id',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'organization_id': 'Int64',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
-        logger.info("Calculating monthly rate of the active therapists per Organization...")
-
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/yearly'
-
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
-
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'organization_id',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{YEARLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
+        self._calculate_rates(
+            input_file=f'{path}/{YEARLY_RATE_INPUT_FILENAME}.csv',
+            names=ORG_RATE_INPUT_COLUMNS,
+            dtype=ORG_RATE_INPUT_DTYPES,
+            output_columns=ORG_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{ORG_RATE_DIR}/yearly',
+            filename=YEARLY_RATE_OUTPUT_FILENAME
         )
 
 
@@ -354,70 +301,17 @@ class NDWeeklyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists in NiceDay
         and writes the result into CSV file.
         """
-        logger.info("Load input of weekly active therapists in NiceDay from disk...")
-
-        # Step 1 - Load input of weekly active therapists
-        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/weekly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
         logger.info("Calculating weekly rate of the active therapists in NiceDay...")
 
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/weekly'
-
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/weekly'
 
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{WEEKLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
+        self._calculate_rates(
+            input_file=f'{path}/{WEEKLY_RATE_INPUT_FILENAME}.csv',
+            names=APP_RATE_INPUT_COLUMNS,
+            dtype=APP_RATE_INPUT_DTYPES,
+            output_columns=APP_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/weekly',
+            filename=WEEKLY_RATE_OUTPUT_FILENAME
         )
 
 
@@ -440,70 +334,17 @@ class NDMonthlyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists in NiceDay
         and writes the result into CSV file.
         """
-        logger.info("Load input of monthly active therapists in NiceDay from disk...")
-
-        # Step 1 - Load input of monthly active therapists
-        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/monthly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
         logger.info("Calculating monthly rate of the active therapists in NiceDay...")
 
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
-
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/monthly'
-
-        is_exists = os.path.exists(output_path)
-
-        if not is_exists:
-            os.makedirs(output_path)
+        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/monthly'
 
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{MONTHLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
+        self._calculate_rates(
+            input_file=f'{path}/{MONTHLY_RATE_INPUT_FILENAME}.csv',
+            names=APP_RATE_INPUT_COLUMNS,
+            dtype=APP_RATE_INPUT_DTYPES,
+            output_columns=APP_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/monthly',
+            filename=MONTHLY_RATE_OUTPUT_FILENAME
         )
 
 
@@ -526,71 +367,27 @@ class NDYearlyActiveTherapistRate(ActiveTherapistRate):
         Calculate rate of the active therapists in NiceDay
         and writes the result into CSV file.
         """
-        logger.info("Load input of yearly active therapists in NiceDay from disk...")
-
-        # Step 1 - Load input of yearly active therapists
-        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/yearly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{YEARLY_RATE_INPUT_FILENAME}.csv',
-            sep=',',
-            names=[
-                'period_start',
-                'period_end',
-                'active_ther',
-                'inactive_ther',
-                'total_ther',
-                'active_ther_b_period',
-                'inactive_ther_b_period'
-            ],
-            dtype={
-                'period_start': 'str',
-                'period_end': 'str',
-                'active_ther': 'Int64',
-                'inactive_ther': 'Int64',
-                'total_ther': 'Int64',
-                'active_ther_b_period': 'Int64',
-                'inactive_ther_b_period': 'Int64'
-            },
-            parse_dates=['period_start', 'period_end']
-        )
-
         logger.info("Calculating yearly rate of the active therapists in NiceDay...")
 
-        # Step 1 - Generate `churn_rate` column
-        dataframe['churn_rate'] = dataframe.apply(
-            lambda row: self._get_churn_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
-        )
+        path = f'{INPUT_RATE_PATH}/{APP_RATE_DIR}/yearly'
 
-        # Step 2 - Generate `retention_rate` column
-        dataframe['retention_rate'] = dataframe.apply(
-            lambda row: self._get_retention_rate(row['active_ther_b_period'], row['active_ther']),
-            axis=1
+        self._calculate_rates(
+            input_file=f'{path}/{YEARLY_RATE_INPUT_FILENAME}.csv',
+            names=APP_RATE_INPUT_COLUMNS,
+            dtype=APP_RATE_INPUT_DTYPES,
+            output_columns=APP_RATE_OUTPUT_COLUMNS,
+            path=f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/yearly',
+            filename=YEARLY_RATE_OUTPUT_FILENAME
         )
 
-        logger.info("Save therapists' rates data into CSV file...")
-
-        # Step 3 - Save results into CSV file
-        # * Create output directory if it doesn't exists
-        output_path = f'{OUTPUT_RATE_PATH}/{APP_RATE_DIR}/yearly'
 
-        is_exists = os.path.exists(output_path)
+def _calculate_rate(rate_class: type) -> None:
+    """
+    Runs the rate calculation of that `rate_class`.
 
-        if not is_exists:
-            os.makedirs(output_path)
-
-        # * Export dataframe to CSV file
-        dataframe[[
-            'period_start',
-            'period_end',
-            'churn_rate',
-            'retention_rate',
-        ]].to_csv(
-            f'{output_path}/{YEARLY_RATE_OUTPUT_FILENAME}.csv',
-            index=False,
-            header=False
-        )
+    Defined at the module level, so it can be pickled by the process pool.
+    """
+    rate_class()
 
 
 class TherapistRateProcessor:
@@ -599,13 +396,24 @@ class TherapistRateProcessor:
         # Runs data processor
         process_start_at = datetime.now()
 
-        OrgWeeklyActiveTherapistRate()
-        OrgMonthlyActiveTherapistRate()
-        OrgYearlyActiveTherapistRate()
-
-        NDWeeklyActiveTherapistRate()
-        NDMonthlyActiveTherapistRate()
-        NDYearlyActiveTherapistRate()
+        # Every rate calculation reads and writes its own files,
+        # therefore we can run all of them concurrently in separate processes.
+        rate_classes = [
+            OrgWeeklyActiveTherapistRate,
+            OrgMonthlyActiveTherapistRate,
+            OrgYearlyActiveTherapistRate,
+            NDWeeklyActiveTherapistRate,
+            NDMonthlyActiveTherapistRate,
+            NDYearlyActiveTherapistRate,
+        ]
+
+        # Forks the workers on Linux so they inherit the already imported pandas & numpy
+        # instead of importing them again on every worker.
+        mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+
+        with ProcessPoolExecutor(max_workers=len(rate_classes), mp_context=mp_context) as executor:
+            # Consumes the results to re-raise any exception from the workers
+            list(executor.map(_calculate_rate, rate_classes))
 
         process_end_at = datetime.now()
         print_time_duration("Therapists' rates data processing", process_start_at, process_end_at)
@@ -63,10 +63,7 @@ class TherapistDataProcessor:
 
         # Step 4 - Create input files with CSV format
         # * Create output directory if it doesn't exists
-        is_exists = os.path.exists(THERAPIST_INPUT_PATH)
-
-        if not is_exists:
-            os.makedirs(THERAPIST_INPUT_PATH)
+        os.makedirs(THERAPIST_INPUT_PATH, exist_ok=True)
 
         # * Slice dataframe into 10 partitions
         dataframe = dataframe.repartition(npartitions=10)
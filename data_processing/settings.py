@@ -2,16 +2,53 @@ import os
 import logging
 
 
-DEV_MODE = os.environ.get('DEV_MODE', False)
-DEBUG_MODE = os.environ.get('DEBUG_MODE', True)
+def _envbool(name: str, default: bool) -> bool:
+    """
+    Returns the value of that `name` environment variable as a boolean,
+    or that `default` value if the variable is not set.
+    """
+    value = os.environ.get(name)
+
+    if value is None:
+        return default
+
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+DEV_MODE = _envbool('DEV_MODE', False)
+DEBUG_MODE = _envbool('DEBUG_MODE', True)
 
 # Holistic Backend API
 BACKEND_URL = os.environ.get('BACKEND_URL', '')
 BACKEND_SERVICE_ACCOUNT = os.environ.get('BACKEND_SERVICE_ACCOUNT', '')
 BACKEND_SERVICE_ACCOUNT_PASSWORD = os.environ.get('BACKEND_SERVICE_ACCOUNT_PASSWORD', '')
 
+# Maximum number of connections kept alive to the Backend,
+# it should cover all of the concurrent sync back upsert workers.
+BACKEND_MAX_CONNECTIONS = int(os.environ.get('BACKEND_MAX_CONNECTIONS', 128))
+
+# Number of concurrent upsert requests to the Backend per sync back phase.
+# Set it to 1 to run the whole sync back serially, including its phases and synchronizers.
+SYNC_BACK_MAX_WORKERS = int(os.environ.get('SYNC_BACK_MAX_WORKERS', 8))
+
+# Maximum number of records sent in a single NiceDay upsert request.
+SYNC_BACK_BATCH_SIZE = int(os.environ.get('SYNC_BACK_BATCH_SIZE', 1000))
+
+
+_logging_configured = False
+
 
 def configure_logging():
+    """
+    Configures the root logger once, following calls are no-op.
+    """
+    global _logging_configured
+
+    if _logging_configured:
+        return
+
+    _logging_configured = True
+
     if DEBUG_MODE:
         logging.root.setLevel(logging.INFO)
         logging.basicConfig(level=logging.INFO)
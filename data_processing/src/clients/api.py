@@ -1,29 +1,89 @@
 import requests
+import shutil
+import threading
+import time
 
 from os.path import exists
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
+from urllib3.util.retry import Retry
 
 from data_processing import settings
+from data_processing.settings import BACKEND_MAX_CONNECTIONS, DEBUG_MODE
 from data_processing.src.tracers import endpoint_tracer, response_tracer
 
 
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Guards the access token refresh of the shared session
+_TOKEN_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns the HTTP session shared by all of the Backend API clients.
+
+    The session keeps its connections to the Backend alive,
+    so we don't have to open a new connection on every request.
+    """
+    global _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=BACKEND_MAX_CONNECTIONS,
+                # Returns the last response once the retries run out,
+                # so its error status is raised as an `HTTPError` like before.
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False
+                )
+            )
+
+            _SESSION = requests.Session()
+            _SESSION.mount('http://', adapter)
+            _SESSION.mount('https://', adapter)
+
+    return _SESSION
+
+
 class BackendAPIClient:
 
     def __init__(self):
         self._FILE_ACCESS_TOKEN = '.backend.access_token.tmp'
+
+        # The Backend access token is valid for 1 day,
+        # we trust a cached token younger than this (in seconds) without validating it.
+        self._ACCESS_TOKEN_MAX_AGE = 23 * 60 * 60
+
+        self._session = _get_session()
         self._ACCESS_TOKEN = self._get_access_token()
 
+        # Persists the access token on the shared session, so every following request is authenticated with it.
+        # All of the clients login with the same service account, hence they share the same token.
+        self._session.headers['Authorization'] = f"Token {self._ACCESS_TOKEN}"
+
     def _get_access_token(self) -> str:
         """
-        Reads the user's access token from local file and validates it.
+        Reads the user's access token from local file and validates it if it's stale.
         If absent or invalid, it generates a new token and writes it to the temp file.
 
         Returns the user's access token.
         """
 
-        token = self._read_access_token()
-        if token and self._validate_access_token(token):
+        token, issued_at = self._read_access_token()
+        if not token:
+            return self._login()
+
+        if issued_at and time.time() - issued_at < self._ACCESS_TOKEN_MAX_AGE:
+            return token
+
+        if self._validate_access_token(token):
             return token
 
         return self._login()
@@ -72,27 +132,55 @@ class BackendAPIClient:
 
     def _write_access_token(self, token) -> None:
         """
-        Write that Backend access `token` into disk.
+        Write that Backend access `token` and its issued time into disk.
         """
 
         with open(self._FILE_ACCESS_TOKEN, "w") as file_access_token:
-            file_access_token.write(token)
+            file_access_token.write(f'{token}\n{time.time()}')
 
-    def _read_access_token(self) -> Union[str, None]:
+    def _read_access_token(self) -> Tuple[Union[str, None], Union[float, None]]:
         """
-        Read access token from the temporary file.
+        Read access token and its issued time from the temporary file.
 
-        Returns the access token or None.
+        Returns a tuple of the access token and its issued time, either of them could be None.
         """
 
         if not exists(self._FILE_ACCESS_TOKEN):
-            return None
+            return None, None
 
         with open(self._FILE_ACCESS_TOKEN, "r") as file_access_token:
             try:
-                return file_access_token.read()
+                lines = file_access_token.read().splitlines()
             except Exception:
-                return None
+                return None, None
+
+        token = lines[0] if lines else None
+
+        # Token files written by older versions don't have the issued time.
+        try:
+            issued_at = float(lines[1])
+        except (IndexError, ValueError):
+            issued_at = None
+
+        return token, issued_at
+
+    def _refresh_access_token(self, rejected_authorization: str) -> None:
+        """
+        Generates a new access token and persists it on the session.
+
+        The requests run concurrently, so only the first of them that got rejected
+        with that `rejected_authorization` logs in again, the others reuse its new token.
+        """
+
+        with _TOKEN_LOCK:
+            authorization = self._session.headers.get('Authorization')
+
+            if authorization != rejected_authorization:
+                self._ACCESS_TOKEN = authorization[len('Token '):]
+                return
+
+            self._ACCESS_TOKEN = self._login()
+            self._session.headers['Authorization'] = f"Token {self._ACCESS_TOKEN}"
 
     def _auth_request(self, method, path, payload={}, headers=None) -> requests.Response:
 
@@ -106,10 +194,10 @@ class BackendAPIClient:
         if headers:
             req_headers.update(headers)
 
-        hooks = {'response': response_tracer} if settings.DEBUG_MODE else None
+        hooks = {'response': response_tracer} if DEBUG_MODE else None
         auth = (payload.get('username'), payload.get('password'))
 
-        response = requests.request(method, url, auth=auth, headers=req_headers, hooks=hooks)
+        response = self._session.request(method, url, auth=auth, headers=req_headers, hooks=hooks)
         response.raise_for_status()
 
         return response
@@ -119,16 +207,22 @@ class BackendAPIClient:
         url = settings.BACKEND_URL + path
         req_headers = {
             "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Token {self._ACCESS_TOKEN}" if hasattr(self, '_ACCESS_TOKEN') else None
+            "Content-Type": "application/json"
         }
 
         if headers:
             req_headers.update(headers)
 
-        hooks = {'response': response_tracer} if settings.DEBUG_MODE else None
+        hooks = {'response': response_tracer} if DEBUG_MODE else None
+
+        response = self._session.request(method, url, json=payload, headers=req_headers, hooks=hooks)
+
+        # The cached access token has been revoked or expired,
+        # login again and retry the request once with the new token.
+        if response.status_code == 401 and not headers:
+            self._refresh_access_token(response.request.headers.get('Authorization'))
+            response = self._session.request(method, url, json=payload, headers=req_headers, hooks=hooks)
 
-        response = requests.request(method, url, json=payload, headers=req_headers, hooks=hooks)
         response.raise_for_status()
 
         return response
@@ -137,24 +231,34 @@ class BackendAPIClient:
 
         url = settings.BACKEND_URL + path
         req_headers = {
-            "Accept": "*/*",
-            "Authorization": f"Token {self._ACCESS_TOKEN}" if hasattr(self, '_ACCESS_TOKEN') else None
+            "Accept": "*/*"
         }
 
         if headers:
             req_headers.update(headers)
 
-        chunk_size = 4096
-        hooks = {'response': endpoint_tracer} if settings.DEBUG_MODE else None
+        hooks = {'response': endpoint_tracer} if DEBUG_MODE else None
 
-        with requests.post(url, data=payload, headers=req_headers, stream=True, hooks=hooks) as req:
-            with open(download_as, 'wb') as file:
-                # Writes response data in chunk
-                for chunk in req.iter_content(chunk_size):
-                    if not chunk:
-                        continue
+        response = self._session.post(url, data=payload, headers=req_headers, stream=True, hooks=hooks)
 
-                    file.write(chunk)
+        # The cached access token has been revoked or expired,
+        # login again and retry the download once with the new token.
+        if response.status_code == 401 and not headers:
+            response.close()
+            self._refresh_access_token(response.request.headers.get('Authorization'))
+            response = self._session.post(url, data=payload, headers=req_headers, stream=True, hooks=hooks)
+
+        with response:
+            # Don't write an error body into the downloaded file
+            response.raise_for_status()
+
+            # Decodes the response body if it's compressed (e.g. gzip)
+            # since we're reading from the raw stream.
+            response.raw.decode_content = True
+
+            with open(download_as, 'wb') as file:
+                # Writes response data in 1 MB chunks
+                shutil.copyfileobj(response.raw, file, length=1 << 20)
 
 
 class TherapistAPI(BackendAPIClient):
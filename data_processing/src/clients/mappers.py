@@ -1,311 +1,151 @@
-from dateutil.parser import parse
-from dateutil.relativedelta import relativedelta
-from itertools import chain
+from calendar import monthrange
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
 
+import numpy as np
 from pandas import DataFrame, Series
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
-class TotalTherapistMapper:
+@lru_cache(maxsize=4096)
+def _get_monthly_bounds(period: str) -> Tuple[str, str]:
+    """
+    Returns the start and end dates of that given monthly `period`.
 
-    def to_nd_total_thers(self, dataframe: DataFrame, period_type: str) -> List[Dict]:
-        """
-        Converts that given `dataframe` into a list of the total therapists
-        in NiceDay on that specific `period_type`.
+    Results are cached since the same period repeats for every organization.
+    """
+    try:
+        period_start = date.fromisoformat(f'{period}-01')
+    except ValueError:
+        # Falls back to the slower but lenient parser for non-ISO periods,
+        # it's imported here since most of the runs never need it.
+        from dateutil.parser import parse
 
-        Dataframe's row is defined by:
-        ```
-        [{period},{active_ther},{inactive_ther},{total_ther}]
-        """
-        total_ther_lists = [
-            self._get_nd_total_thers(row, period_type)
-            for _, row in dataframe.iterrows()
-        ]
+        period_start = parse(f'{period}-01', yearfirst=True)
+        period = period_start.strftime('%Y-%m')
 
-        return list(chain.from_iterable(total_ther_lists))
+    _, last_day = monthrange(period_start.year, period_start.month)
 
-    def to_org_total_thers_map(self, dataframe: DataFrame, period_type: str) -> Dict:
-        """
-        Converts that given `dataframe` into the total therapists
-        per organization dictionary for that specific `period_type`
-        grouped by the organization id.
+    return f'{period}-01', f'{period}-{last_day:02d}'
 
-        Dataframe's row is defined by:
-        ```
-        [{period},{org_id},{active_ther},{inactive_ther},{total_ther}]
-        """
-        map = {}
-
-        for _, row in dataframe.iterrows():
-
-            org_id = int(row[1])
-            org_num_of_thers = self._get_org_total_thers(row, period_type)
 
-            if map.get(org_id):
-                existing = map[org_id]
+@lru_cache(maxsize=4096)
+def _get_yearly_bounds(period: str) -> Tuple[str, str]:
+    """
+    Returns the start and end dates of that given yearly `period`.
+    """
+    return f'{period}-01-01', f'{period}-12-31'
 
-                map[org_id] = existing + org_num_of_thers
 
-                continue
+def _group_by_org(org_ids: Series, records: List[Dict]) -> Dict:
+    """
+    Groups those given `records` by the organization id of the rows they're built from.
 
-            map[org_id] = org_num_of_thers
+    Every row produces two records, which are built one after another.
+    """
+    map = defaultdict(list)
 
-        return map
+    for org_id, record in zip(np.repeat(org_ids.to_numpy(dtype='int64'), 2).tolist(), records):
+        map[org_id].append(record)
 
-    def _get_org_total_thers(self, row: Series, period_type: str) -> List[Dict]:
-        """
-        Converts that given `row` into a list of the total therapists dictionary.
-        """
-        if period_type == 'weekly':
-            return self._get_org_weekly_total_thers(row)
+    return dict(map)
 
-        elif period_type == 'monthly':
-            return self._get_org_monthly_total_thers(row)
 
-        elif period_type == 'yearly':
-            return self._get_org_yearly_total_thers(row)
+class TotalTherapistMapper:
 
-        return []
+    def __init__(self) -> None:
+        # Bounds getter of every single-date period type,
+        # the weekly & alltime periods already contain their bounds.
+        self._bounds_getters = {
+            'monthly': _get_monthly_bounds,
+            'yearly': _get_yearly_bounds,
+        }
 
-    def _get_org_weekly_total_thers(self, row: Series) -> List[Dict]:
+    def to_nd_total_thers(self, dataframe: DataFrame, period_type: str) -> List[Dict]:
         """
-        Converts that given `row` into a list of the total therapists dictionary.
+        Converts that given `dataframe` into a list of the total therapists
+        in NiceDay on that specific `period_type`.
 
-        Row is defined by:
-        ```
-        [{period},{org_id},{active_ther},{inactive_ther},{total_ther}]
+        Dataframe's row is defined by:
         ```
+        [{period},{active_ther},{inactive_ther},{total_ther}]
         """
+        period_starts, period_ends = self._get_period_bounds(dataframe[0], period_type)
 
-        period = row[0]
-        period_start, period_end = period.split('/')
-
-        return [
-            {
-                'period_type': 'weekly',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': True,
-                'value': int(row[2])
-            },
-            {
-                'period_type': 'weekly',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': False,
-                'value': int(row[3])
-            }
-        ]
-
-    def _get_org_monthly_total_thers(self, row: Series) -> List[Dict]:
-        """
-        Converts that given `row` into a list of the total therapists dictionary.
+        return self._get_total_thers(period_starts, period_ends, dataframe[[1, 2]], period_type)
 
-        Row is defined by:
-        ```
-        [{period},{org_id},{active_ther},{inactive_ther},{total_ther}]
-        ```
-        """
-        period = row[0]
-        period_start = parse(f'{period}-01', yearfirst=True)
-        period_end = period_start + relativedelta(day=31)
-
-        str_period_start = period_start.strftime('%Y-%m-%d')
-        str_period_end = period_end.strftime('%Y-%m-%d')
-
-        return [
-            {
-                'period_type': 'monthly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': True,
-                'value': int(row[2])
-            },
-            {
-                'period_type': 'monthly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': False,
-                'value': int(row[3])
-            }
-        ]
-
-    def _get_org_yearly_total_thers(self, row: Series) -> List[Dict]:
+    def to_org_total_thers_map(self, dataframe: DataFrame, period_type: str) -> Dict:
         """
-        Converts that given `row` into a list of the total therapists dictionary.
+        Converts that given `dataframe` into the total therapists
+        per organization dictionary for that specific `period_type`
+        grouped by the organization id.
 
-        Row is defined by:
+        Dataframe's row is defined by:
         ```
         [{period},{org_id},{active_ther},{inactive_ther},{total_ther}]
-        ```
         """
+        period_starts, period_ends = self._get_period_bounds(dataframe[0], period_type)
+        total_thers = self._get_total_thers(period_starts, period_ends, dataframe[[2, 3]], period_type)
+
+        # Every row produces the active & inactive records of its organization
+        return _group_by_org(dataframe[1], total_thers)
 
-        period = row[0]
-        period_start = parse(f'{period}-01-01', yearfirst=True)
-        period_end = parse(f'{period}-12-01', yearfirst=True) + relativedelta(day=31)
-
-        str_period_start = period_start.strftime('%Y-%m-%d')
-        str_period_end = period_end.strftime('%Y-%m-%d')
-
-        return [
-            {
-                'period_type': 'yearly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': True,
-                'value': int(row[2])
-            },
-            {
-                'period_type': 'yearly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': False,
-                'value': int(row[3])
-            }
-        ]
-
-    def _get_nd_total_thers(self, row: Series, period_type: str) -> List[Dict]:
+    def _get_period_bounds(self, periods: Series, period_type: str) -> Tuple[List[str], List[str]]:
         """
-        Converts that given `row` into a list of the total therapists dictionary.
+        Converts that given `periods` into the lists of start and end dates
+        for that specific `period_type`.
         """
+        if periods.empty:
+            return [], []
 
-        if period_type == 'alltime':
-            return self._get_nd_alltime_total_thers(row)
+        if period_type in ('alltime', 'weekly'):
+            # Splits the `{period_start}/{period_end}` periods at once
+            # instead of splitting them row by row.
+            splits = periods.str.split('/', n=1, expand=True)
 
-        elif period_type == 'weekly':
-            return self._get_nd_weekly_total_thers(row)
+            return splits[0].tolist(), splits[1].tolist()
 
-        elif period_type == 'monthly':
-            return self._get_nd_monthly_total_thers(row)
+        get_bounds = self._bounds_getters.get(period_type)
+        if not get_bounds:
+            return [], []
 
-        elif period_type == 'yearly':
-            return self._get_nd_yearly_total_thers(row)
+        bounds = [get_bounds(period) for period in periods.tolist()]
 
-        return []
+        period_starts = [period_start for period_start, _ in bounds]
+        period_ends = [period_end for _, period_end in bounds]
 
-    def _get_nd_alltime_total_thers(self, row: Series) -> List[Dict]:
-        """
-        Converts that given `row` into a list of the total therapists dictionary.
-
-        Dataframe's row is defined by:
-        ```
-        [{period},{total_active_thers},{total_inactive_thers},{total_thers}]
-        """
-        period_start, period_end = row[0].split('/')
-
-        return [
-            {
-                'period_type': 'alltime',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': True,
-                'value': int(row[1])
-            },
-            {
-                'period_type': 'alltime',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': False,
-                'value': int(row[2])
-            }
-        ]
-
-    def _get_nd_weekly_total_thers(self, row: Series) -> List[Dict]:
-        """
-        Converts that given `row` into a list of the total therapists dictionary.
-
-        Row is defined by:
-        ```
-        [{period},{active_ther},{inactive_ther},{total_ther}]
-        ```
-        """
+        return period_starts, period_ends
 
-        period = row[0]
-        period_start, period_end = period.split('/')
-
-        return [
-            {
-                'period_type': 'weekly',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': True,
-                'value': int(row[1])
-            },
-            {
-                'period_type': 'weekly',
-                'start_date': period_start,
-                'end_date': period_end,
-                'is_active': False,
-                'value': int(row[2])
-            }
-        ]
-
-    def _get_nd_monthly_total_thers(self, row: Series) -> List[Dict]:
+    def _get_total_thers(
+        self,
+        period_starts: List[str],
+        period_ends: List[str],
+        values: DataFrame,
+        period_type: str
+    ) -> List[Dict]:
         """
-        Converts that given `row` into a list of the total therapists dictionary.
+        Converts those given periods and `values` into a list of the total therapists.
 
-        Row is defined by:
+        Values' row is defined by:
         ```
-        [{period},{active_ther},{inactive_ther},{total_ther}]
+        [{active_ther},{inactive_ther}]
         ```
         """
-        period = row[0]
-        period_start = parse(f'{period}-01', yearfirst=True)
-        period_end = period_start + relativedelta(day=31)
-
-        str_period_start = period_start.strftime('%Y-%m-%d')
-        str_period_end = period_end.strftime('%Y-%m-%d')
-
-        return [
-            {
-                'period_type': 'monthly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': True,
-                'value': int(row[1])
-            },
-            {
-                'period_type': 'monthly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': False,
-                'value': int(row[2])
-            }
-        ]
-
-    def _get_nd_yearly_total_thers(self, row: Series) -> List[Dict]:
-        """
-        Converts that given `row` into a list of the total therapists dictionary.
+        if not period_starts:
+            return []
 
-        Row is defined by:
-        ```
-        [{period},{active_ther},{inactive_ther},{total_ther}]
-        ```
-        """
+        # Builds the active & inactive records of every row column-wise,
+        # one after another, so the records keep the order of the rows.
+        total_thers = DataFrame({
+            'period_type': period_type,
+            'start_date': np.repeat(period_starts, 2),
+            'end_date': np.repeat(period_ends, 2),
+            'is_active': np.tile([True, False], len(period_starts)),
+            'value': values.to_numpy(dtype='int64').ravel()
+        })
 
-        period = row[0]
-        period_start = parse(f'{period}-01-01', yearfirst=True)
-        period_end = parse(f'{period}-12-01', yearfirst=True) + relativedelta(day=31)
-
-        str_period_start = period_start.strftime('%Y-%m-%d')
-        str_period_end = period_end.strftime('%Y-%m-%d')
-
-        return [
-            {
-                'period_type': 'yearly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': True,
-                'value': int(row[1])
-            },
-            {
-                'period_type': 'yearly',
-                'start_date': str_period_start,
-                'end_date': str_period_end,
-                'is_active': False,
-                'value': int(row[2])
-            }
-        ]
+        return total_thers.to_dict('records')
 
 
 class TherapistRateMapper:
@@ -320,28 +160,7 @@ class TherapistRateMapper:
         [{period_start},{period_end},{churn_rate},{retention_rate}]
         ```
         """
-        rates = []
-
-        for _, row in dataframe.iterrows():
-
-            rates += [
-                {
-                    'period_type': period_type,
-                    'start_date': f'{row[0]}',
-                    'end_date': f'{row[1]}',
-                    'type': 'churn_rate',
-                    'value': float(row[2])
-                },
-                {
-                    'period_type': period_type,
-                    'start_date': f'{row[0]}',
-                    'end_date': f'{row[1]}',
-                    'type': 'retention_rate',
-                    'value': float(row[3])
-                }
-            ]
-
-        return rates
+        return self._get_rates(dataframe[0], dataframe[1], dataframe[[2, 3]], period_type)
 
     def to_org_rates_map(self, dataframe: DataFrame, period_type: str) -> Dict:
         """
@@ -353,47 +172,34 @@ class TherapistRateMapper:
         [{period_start},{period_end},{org_id},{churn_rate},{retention_rate}]
         ```
         """
-        map = {}
-
-        for _, row in dataframe.iterrows():
-
-            org_id = int(row[2])
-            org_rates = self._get_rate(row, period_type)
-
-            if map.get(org_id):
-                existing = map[org_id]
+        rates = self._get_rates(dataframe[0], dataframe[1], dataframe[[3, 4]], period_type)
 
-                map[org_id] = existing + org_rates
+        # Every row produces the churn & retention records of its organization
+        return _group_by_org(dataframe[2], rates)
 
-                continue
-
-            map[org_id] = org_rates
-
-        return map
-
-    def _get_rate(self, row: Series, period_type: str) -> List[Dict]:
+    def _get_rates(
+        self,
+        period_starts: Series,
+        period_ends: Series,
+        rate_values: DataFrame,
+        period_type: str
+    ) -> List[Dict]:
         """
-        Converts that given `row` into a list of therapists' rates dictionary.
+        Converts those given periods and `rate_values` into a list of the therapists' rates.
 
-        Row is defined by:
+        Rate values' row is defined by:
         ```
-        [{period_start},{period_end},{org_id},{churn_rate},{retention_rate}]
+        [{churn_rate},{retention_rate}]
         ```
         """
+        # Builds the churn & retention records of every row column-wise,
+        # one after another, so the records keep the order of the rows.
+        rates = DataFrame({
+            'period_type': period_type,
+            'start_date': np.repeat(period_starts.astype(str).to_numpy(), 2),
+            'end_date': np.repeat(period_ends.astype(str).to_numpy(), 2),
+            'type': np.tile(['churn_rate', 'retention_rate'], len(rate_values)),
+            'value': rate_values.to_numpy(dtype='float64').ravel()
+        })
 
-        return [
-            {
-                'period_type': period_type,
-                'start_date': f'{row[0]}',
-                'end_date': f'{row[1]}',
-                'type': 'churn_rate',
-                'value': float(row[3])
-            },
-            {
-                'period_type': period_type,
-                'start_date': f'{row[0]}',
-                'end_date': f'{row[1]}',
-                'type': 'retention_rate',
-                'value': float(row[4])
-            }
-        ]
+        return rates.to_dict('records')
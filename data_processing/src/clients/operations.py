@@ -1,10 +1,9 @@
 import logging
 import pandas as pd
 
-from dask import dataframe as dask_dataframe
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from data_processing import settings
+from data_processing.settings import DEV_MODE, SYNC_BACK_BATCH_SIZE
 
 from data_processing.src.clients.api import (
     InteractionAPI,
@@ -16,6 +15,10 @@ from data_processing.src.clients.mappers import (
     TotalTherapistMapper,
     TherapistRateMapper,
 )
+from data_processing.src.helpers import run_concurrently
+
+if TYPE_CHECKING:
+    from dask import dataframe as dask_dataframe
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,51 @@ WEEKLY_RATE_FILENAME = 'output-weekly-rate'
 MONTHLY_RATE_FILENAME = 'output-monthly-rate'
 YEARLY_RATE_FILENAME = 'output-yearly-rate'
 
+ORG_ACTIVE_THER_FILES = {
+    'weekly': f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/weekly/{WEEKLY_ACTIVE_THER_FILENAME}.csv',
+    'monthly': f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/monthly/{MONTHLY_ACTIVE_THER_FILENAME}.csv',
+    'yearly': f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/yearly/{YEARLY_ACTIVE_THER_FILENAME}.csv',
+}
+APP_ACTIVE_THER_FILES = {
+    'alltime': f'{OUTPUT_ACTIVE_THER_PATH}/alltime/{ALLTIME_ACTIVE_THER_FILENAME}.csv',
+    'weekly': f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/weekly/{WEEKLY_ACTIVE_THER_FILENAME}.csv',
+    'monthly': f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/monthly/{MONTHLY_ACTIVE_THER_FILENAME}.csv',
+    'yearly': f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/yearly/{YEARLY_ACTIVE_THER_FILENAME}.csv',
+}
+
+ORG_RATE_FILES = {
+    'weekly': f'{OUTPUT_RATE_PATH}/{ORG_DIR}/weekly/{WEEKLY_RATE_FILENAME}.csv',
+    'monthly': f'{OUTPUT_RATE_PATH}/{ORG_DIR}/monthly/{MONTHLY_RATE_FILENAME}.csv',
+    'yearly': f'{OUTPUT_RATE_PATH}/{ORG_DIR}/yearly/{YEARLY_RATE_FILENAME}.csv',
+}
+APP_RATE_FILES = {
+    'weekly': f'{OUTPUT_RATE_PATH}/{APP_DIR}/weekly/{WEEKLY_RATE_FILENAME}.csv',
+    'monthly': f'{OUTPUT_RATE_PATH}/{APP_DIR}/monthly/{MONTHLY_RATE_FILENAME}.csv',
+    'yearly': f'{OUTPUT_RATE_PATH}/{APP_DIR}/yearly/{YEARLY_RATE_FILENAME}.csv',
+}
+
+# Size of every dask partition of the Backend exports,
+# bigger partitions keep the task graph and its scheduling overhead small.
+DASK_BLOCKSIZE = '128MB'
+
+# Column data types of the aggregate files, so pandas doesn't have to infer them.
+# The processors never write missing values into them, so their readers skip the NA detection as well.
+ORG_ACTIVE_THER_DTYPES = {0: 'str', 1: 'int64', 2: 'int64', 3: 'int64'}
+APP_ACTIVE_THER_DTYPES = {0: 'str', 1: 'int64', 2: 'int64'}
+
+ORG_RATE_DTYPES = {0: 'str', 1: 'str', 2: 'int64', 3: 'float64', 4: 'float64'}
+APP_RATE_DTYPES = {0: 'str', 1: 'str', 2: 'float64', 3: 'float64'}
+
+
+def _split_into_batches(records: List[Dict]) -> List[List[Dict]]:
+    """
+    Splits that given `records` into batches of `SYNC_BACK_BATCH_SIZE` records.
+    """
+    return [
+        records[i:i + SYNC_BACK_BATCH_SIZE]
+        for i in range(0, len(records), SYNC_BACK_BATCH_SIZE)
+    ]
+
 
 class TherapistBackendOperation:
 
@@ -44,7 +92,7 @@ class TherapistBackendOperation:
         self.api = TherapistAPI()
 
     @property
-    def data(self) -> dask_dataframe:
+    def data(self) -> 'dask_dataframe.DataFrame':
         """
         Returns the Therapist dask's dataframe.
         """
@@ -65,7 +113,11 @@ class TherapistBackendOperation:
 
         logger.info("Collecting Therapist data from Backend or importing from disk...")
 
-        if not settings.DEV_MODE:
+        # Dask is only needed by the data processors,
+        # it's imported here so the sync back app doesn't have to load it.
+        from dask import dataframe as dask_dataframe
+
+        if not DEV_MODE:
             self.api.download_data(format='csv')
 
         self._ddf = dask_dataframe.read_csv(
@@ -75,8 +127,9 @@ class TherapistBackendOperation:
                 'organization_id': 'Int64',
                 'date_joined': str
             },
-            parse_dates=['date_joined']
-        )
+            parse_dates=['date_joined'],
+            blocksize=DASK_BLOCKSIZE
+        ).persist()
 
 
 class InteractionBackendOperation:
@@ -85,7 +138,7 @@ class InteractionBackendOperation:
         self.api = InteractionAPI()
 
     @property
-    def data(self) -> dask_dataframe:
+    def data(self) -> 'dask_dataframe.DataFrame':
         """
         Returns the Interaction dask's dataframe.
         """
@@ -106,7 +159,11 @@ class InteractionBackendOperation:
 
         logger.info("Collecting Interaction data from Backend or importing from disk...")
 
-        if not settings.DEV_MODE:
+        # Dask is only needed by the data processors,
+        # it's imported here so the sync back app doesn't have to load it.
+        from dask import dataframe as dask_dataframe
+
+        if not DEV_MODE:
             self.api.download_data(format='csv')
 
         self._ddf = dask_dataframe.read_csv(
@@ -120,7 +177,8 @@ class InteractionBackendOperation:
                 'organization_id': 'Int64',
                 'organization_date_joined': str
             },
-            parse_dates=['interaction_date', 'organization_date_joined']
+            parse_dates=['interaction_date', 'organization_date_joined'],
+            blocksize=DASK_BLOCKSIZE
         )
 
 
@@ -133,8 +191,10 @@ class TotalTherapistBackendOperation:
     def upsert(self, total_therapists: List[Dict]) -> None:
         """
         Create or update total therapists in NiceDay.
+
+        The total therapists are sent concurrently in batches.
         """
-        self.api.upsert(total_therapists)
+        run_concurrently(self.api.upsert, _split_into_batches(total_therapists))
 
     def upsert_by_org(self, org_id: int, total_therapists: List[Dict]) -> None:
         """
@@ -142,131 +202,53 @@ class TotalTherapistBackendOperation:
         """
         self.api.upsert_by_org(org_id, total_therapists)
 
-    def get_org_weekly_therapists_map(self) -> Dict:
-        """
-        Returns map of weekly total therapists in the Organization.
-        """
-
-        logger.info("Importing weekly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/weekly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_ACTIVE_THER_FILENAME}.csv',
-            sep='\t',
-            header=None
-        )
-
-        logger.info("Converting weekly total therapist objects into a dictionary...")
-        return self.mapper.to_org_total_thers_map(dataframe, 'weekly')
-
-    def get_org_monthly_therapists_map(self) -> Dict:
-        """
-        Returns map of monthly total therapists in the Organization.
-        """
-
-        logger.info("Importing monthly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/monthly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_ACTIVE_THER_FILENAME}.csv',
-            sep='\t',
-            header=None
-        )
-
-        logger.info("Converting monthly total therapist objects into a dictionary...")
-        return self.mapper.to_org_total_thers_map(dataframe, 'monthly')
-
-    def get_org_yearly_therapists_map(self) -> Dict:
-        """
-        Returns map of yearly total therapists in the Organization.
-        """
-
-        logger.info("Importing yearly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{ORG_DIR}/yearly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{YEARLY_ACTIVE_THER_FILENAME}.csv',
-            sep='\t',
-            header=None
-        )
-
-        logger.info("Converting yearly total therapist objects into a dictionary...")
-        return self.mapper.to_org_total_thers_map(dataframe, 'yearly')
-
-    def get_nd_alltime_therapists(self) -> List[Dict]:
+    def upsert_by_orgs(self, total_therapists_map: Dict) -> None:
         """
-        Returns a list of the total all therapists.
+        Create or update total therapists in every Organization ID of that given map.
         """
+        run_concurrently(self.api.upsert_by_org, total_therapists_map.keys(), total_therapists_map.values())
 
-        logger.info("Importing total all therapists from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/alltime'
-
-        dataframe = pd.read_csv(
-            f'{path}/{ALLTIME_ACTIVE_THER_FILENAME}.csv',
-            sep='\t',
-            header=None
-        )
-
-        logger.info("Converting total all therapist's objects into a list...")
-        return self.mapper.to_nd_total_thers(dataframe, 'alltime')
-
-    def get_nd_weekly_therapists(self) -> List[Dict]:
+    def get_org_therapists_map(self, period_type: str) -> Dict:
         """
-        Returns a list of weekly total therapists in NiceDay.
+        Returns map of the total therapists in the Organization on that `period_type`.
         """
 
-        logger.info("Importing weekly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/weekly'
+        logger.info(f"Importing {period_type} total therapists data from disk...")
 
         dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_ACTIVE_THER_FILENAME}.csv',
+            ORG_ACTIVE_THER_FILES[period_type],
             sep='\t',
-            header=None
+            header=None,
+            usecols=[0, 1, 2, 3],
+            dtype=ORG_ACTIVE_THER_DTYPES,
+            engine='c',
+            na_filter=False,
+            memory_map=True
         )
 
-        logger.info("Converting weekly total therapist objects into a dictionary...")
-        return self.mapper.to_nd_total_thers(dataframe, 'weekly')
+        logger.info(f"Converting {period_type} total therapist objects into a dictionary...")
+        return self.mapper.to_org_total_thers_map(dataframe, period_type)
 
-    def get_nd_monthly_therapists(self) -> List[Dict]:
+    def get_nd_therapists(self, period_type: str) -> List[Dict]:
         """
-        Returns a list of monthly total therapists in NiceDay.
+        Returns a list of the total therapists in NiceDay on that `period_type`.
         """
 
-        logger.info("Importing monthly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/monthly'
+        logger.info(f"Importing {period_type} total therapists data from disk...")
 
         dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_ACTIVE_THER_FILENAME}.csv',
+            APP_ACTIVE_THER_FILES[period_type],
             sep='\t',
-            header=None
+            header=None,
+            usecols=[0, 1, 2],
+            dtype=APP_ACTIVE_THER_DTYPES,
+            engine='c',
+            na_filter=False,
+            memory_map=True
         )
 
-        logger.info("Converting monthly total therapist objects into a dictionary...")
-        return self.mapper.to_nd_total_thers(dataframe, 'monthly')
-
-    def get_nd_yearly_therapists(self) -> List[Dict]:
-        """
-        Returns a list of yearly total therapists in NiceDay.
-        """
-
-        logger.info("Importing yearly total therapists data from disk...")
-
-        path = f'{OUTPUT_ACTIVE_THER_PATH}/{APP_DIR}/yearly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{YEARLY_ACTIVE_THER_FILENAME}.csv',
-            sep='\t',
-            header=None
-        )
-
-        logger.info("Converting yearly total therapist objects into a dictionary...")
-        return self.mapper.to_nd_total_thers(dataframe, 'yearly')
+        logger.info(f"Converting {period_type} total therapist objects into a list...")
+        return self.mapper.to_nd_total_thers(dataframe, period_type)
 
 
 class TherapistRateBackendOperation:
@@ -278,8 +260,10 @@ class TherapistRateBackendOperation:
     def upsert(self, total_therapists: List[Dict]) -> None:
         """
         Create or update therapists' rates in NiceDay.
+
+        The therapists' rates are sent concurrently in batches.
         """
-        self.api.upsert(total_therapists)
+        run_concurrently(self.api.upsert, _split_into_batches(total_therapists))
 
     def upsert_by_org(self, org_id: int, total_therapists: List[Dict]) -> None:
         """
@@ -287,113 +271,51 @@ class TherapistRateBackendOperation:
         """
         self.api.upsert_by_org(org_id, total_therapists)
 
-    def get_org_weekly_rates_map(self) -> Dict:
+    def upsert_by_orgs(self, rates_map: Dict) -> None:
         """
-        Returns map of weekly therapists' rates in the Organization.
+        Create or update therapists' rates in every Organization ID of that given map.
         """
+        run_concurrently(self.api.upsert_by_org, rates_map.keys(), rates_map.values())
 
-        logger.info("Importing weekly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{ORG_DIR}/weekly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_RATE_FILENAME}.csv',
-            sep=',',
-            header=None
-        )
-
-        logger.info("Converting weekly therapist's rate objects into a dictionary...")
-        return self.mapper.to_org_rates_map(dataframe, 'weekly')
-
-    def get_org_monthly_rates_map(self) -> Dict:
+    def get_org_rates_map(self, period_type: str) -> Dict:
         """
-        Returns map of weekly therapists' rates in the Organization.
+        Returns map of the therapists' rates in the Organization on that `period_type`.
         """
 
-        logger.info("Importing monthly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{ORG_DIR}/monthly'
+        logger.info(f"Importing {period_type} therapists' rates data from disk...")
 
         dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_RATE_FILENAME}.csv',
+            ORG_RATE_FILES[period_type],
             sep=',',
-            header=None
+            header=None,
+            dtype=ORG_RATE_DTYPES,
+            engine='c',
+            na_filter=False,
+            memory_map=True
         )
 
-        logger.info("Converting monthly therapist's rate objects into a dictionary...")
-        return self.mapper.to_org_rates_map(dataframe, 'monthly')
+        logger.info(f"Converting {period_type} therapist's rate objects into a dictionary...")
+        return self.mapper.to_org_rates_map(dataframe, period_type)
 
-    def get_org_yearly_rates_map(self) -> Dict:
+    def get_nd_rates(self, period_type: str) -> List[Dict]:
         """
-        Returns map of yearly therapists' rates in the Organization.
+        Returns a list of the therapists' rates in NiceDay on that `period_type`.
         """
 
-        logger.info("Importing yearly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{ORG_DIR}/yearly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{YEARLY_RATE_FILENAME}.csv',
-            sep=',',
-            header=None
-        )
-
-        logger.info("Converting yearly therapist's objects into a dictionary...")
-        return self.mapper.to_org_rates_map(dataframe, 'yearly')
-
-    def get_nd_weekly_rates(self) -> List[Dict]:
-        """
-        Returns a list of weekly therapists' rates in NiceDay.
-        """
-
-        logger.info("Importing weekly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{APP_DIR}/weekly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{WEEKLY_RATE_FILENAME}.csv',
-            sep=',',
-            header=None
-        )
-
-        logger.info("Converting weekly therapist's rate objects into a dictionary...")
-        return self.mapper.to_nd_rates(dataframe, 'weekly')
-
-    def get_nd_monthly_rates(self) -> List[Dict]:
-        """
-        Returns a list of monthly therapists' rates in NiceDay.
-        """
-
-        logger.info("Importing monthly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{APP_DIR}/monthly'
-
-        dataframe = pd.read_csv(
-            f'{path}/{MONTHLY_RATE_FILENAME}.csv',
-            sep=',',
-            header=None
-        )
-
-        logger.info("Converting monthly therapist's rate objects into a dictionary...")
-        return self.mapper.to_nd_rates(dataframe, 'monthly')
-
-    def get_nd_yearly_rates(self) -> List[Dict]:
-        """
-        Returns a list of yearly therapists' rates in NiceDay.
-        """
-
-        logger.info("Importing yearly therapists' rates data from disk...")
-
-        path = f'{OUTPUT_RATE_PATH}/{APP_DIR}/yearly'
+        logger.info(f"Importing {period_type} therapists' rates data from disk...")
 
         dataframe = pd.read_csv(
-            f'{path}/{YEARLY_RATE_FILENAME}.csv',
+            APP_RATE_FILES[period_type],
             sep=',',
-            header=None
+            header=None,
+            dtype=APP_RATE_DTYPES,
+            engine='c',
+            na_filter=False,
+            memory_map=True
         )
 
-        logger.info("Converting yearly therapist's rate objects into a dictionary...")
-        return self.mapper.to_nd_rates(dataframe, 'yearly')
+        logger.info(f"Converting {period_type} therapist's rate objects into a list...")
+        return self.mapper.to_nd_rates(dataframe, period_type)
 
 
 class TotalTherapistVisualizationOperation:
@@ -423,7 +345,7 @@ class TotalTherapistVisualizationOperation:
 
         logger.info("Collecting Interaction data from Backend or importing from disk...")
 
-        if not settings.DEV_MODE:
+        if not DEV_MODE:
             self.api.download_data(format='csv')
 
         self._df = pd.read_csv(
@@ -467,7 +389,7 @@ class TherapistRateVisualizationOperation:
 
         logger.info("Collecting Interaction data from Backend or importing from disk...")
 
-        if not settings.DEV_MODE:
+        if not DEV_MODE:
             self.api.download_data(format='csv')
 
         self._df = pd.read_csv(
@@ -1,40 +1,79 @@
-from dateutil.relativedelta import relativedelta
+import numpy as np
 
+from pandas import Series
+from typing import Tuple
 
-def is_one_week_diff(previous, current):
+
+def _add_months_series(dates: Series, months: Series) -> Series:
+    """
+    Returns those given `dates` shifted by those numbers of `months`.
+
+    The day is clipped to the last day of the target month,
+    e.g. January 31st + 1 month is February 28th (or 29th).
+    """
+    is_valid = dates.notna() & months.notna()
+
+    # Months since the Unix epoch of every target month
+    target_months = (
+        (dates.dt.year - 1970) * 12 + (dates.dt.month - 1) + months
+    ).fillna(0).astype('int64').to_numpy().astype('datetime64[M]')
+
+    month_starts = target_months.astype('datetime64[D]')
+    month_lengths = ((target_months + 1).astype('datetime64[D]') - month_starts).astype('int64')
+
+    days = np.minimum(dates.dt.day.fillna(1).astype('int64').to_numpy(), month_lengths)
+    times = (dates - dates.dt.normalize()).to_numpy()
+
+    shifted = month_starts + (days - 1).astype('timedelta64[D]') + times
+
+    return Series(shifted, index=dates.index).where(is_valid)
+
+
+def _get_months_diff_series(previous: Series, current: Series) -> Tuple[Series, Series]:
+    """
+    Returns the whole months differences between `current` and `previous` dates
+    and the remaining time differences after those months.
+
+    It follows the same rules as `relativedelta(current, previous)`
+    for the `current` dates that are not earlier than the `previous` dates.
+    """
+    months = (current.dt.year - previous.dt.year) * 12 + (current.dt.month - previous.dt.month)
+    shifted = _add_months_series(previous, months)
+
+    # Both dates are on the same month at this point,
+    # so stepping back a single month is always enough.
+    is_overshot = current < shifted
+    months = months - is_overshot
+    shifted = shifted.where(~is_overshot, _add_months_series(previous, months))
+
+    return months, current - shifted
+
+
+def is_one_week_diff_series(previous: Series, current: Series) -> Series:
     """
-    Returns `True` if the days differences between `current`
+    Returns `True` on every row where the days differences between `current`
     and `previous` date is 1 week.
     """
-    if current < previous:
-        return False
+    _, remainder = _get_months_diff_series(previous, current)
 
-    return bool(
-        relativedelta(current, previous).days == 7
-    )
+    return (current >= previous) & (remainder.dt.days == 7)
 
 
-def is_one_month_diff(previous, current):
+def is_one_month_diff_series(previous: Series, current: Series) -> Series:
     """
-    Returns `True` if the months differences between `current`
+    Returns `True` on every row where the months differences between `current`
     and `previous` date is 1 month.
     """
-    if current < previous:
-        return False
+    months, _ = _get_months_diff_series(previous, current)
 
-    return bool(
-        relativedelta(current, previous).months == 1
-    )
+    return (current >= previous) & (months % 12 == 1)
 
 
-def is_one_year_diff(previous, current):
+def is_one_year_diff_series(previous: Series, current: Series) -> Series:
     """
-    Returns `True` if the years differences between `current`
+    Returns `True` on every row where the years differences between `current`
     and `previous` date is 1 year.
     """
-    if current < previous:
-        return False
+    months, _ = _get_months_diff_series(previous, current)
 
-    return bool(
-        relativedelta(current, previous).years == 1
-    )
+    return (current >= previous) & (months // 12 == 1)
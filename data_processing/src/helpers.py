@@ -1,6 +1,10 @@
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Callable
+
+from data_processing.settings import SYNC_BACK_MAX_WORKERS
 
 
 logger = logging.getLogger(__name__)
@@ -13,25 +17,38 @@ def print_time_duration(tag: str, start: datetime, end: datetime):
 
     time_diff = end - start
 
-    days, seconds = time_diff.days, time_diff.seconds
-
-    # The usage of `//` is require to ignore the remainding value
-    hours = days * 24 + seconds // 3600
-    minutes = (seconds % 3600) // 60
-    seconds = seconds % 60
+    hours, remainder = divmod(int(time_diff.total_seconds()), 3600)
+    minutes, seconds = divmod(remainder, 60)
 
-    duration_msg = ''
+    duration_parts = []
 
     if hours > 0:
-        duration_msg += f'{hours} hour(s), '
+        duration_parts.append(f'{hours} hour(s)')
 
     if minutes > 0:
-        duration_msg += f'{minutes} minute(s), '
+        duration_parts.append(f'{minutes} minute(s)')
 
     if seconds > 0:
-        duration_msg += f'{seconds} second(s)'
+        duration_parts.append(f'{seconds} second(s)')
 
-    if not duration_msg:
-        duration_msg += f'{time_diff.microseconds / 1000000} second(s)'
+    duration_msg = ', '.join(duration_parts) or f'{time_diff.microseconds / 1000000} second(s)'
 
     logger.info(f" {tag} is completed in: {duration_msg}")
+
+
+def run_concurrently(fn: Callable, *iterables, max_workers: int = SYNC_BACK_MAX_WORKERS) -> None:
+    """
+    Calls that given `fn` with the arguments taken from every of those `iterables`.
+
+    The calls are expected to be I/O bound, so they're run in a thread pool
+    unless `SYNC_BACK_MAX_WORKERS` is set to 1.
+    """
+    if SYNC_BACK_MAX_WORKERS <= 1 or max_workers <= 1:
+        for args in zip(*iterables):
+            fn(*args)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consumes the results to re-raise any exception from the workers
+        list(executor.map(fn, *iterables))
@@ -1,173 +1,114 @@
 import logging
 
 from datetime import datetime
+from typing import Callable, Type
 
 from data_processing.src.clients.operations import (
     TotalTherapistBackendOperation,
     TherapistRateBackendOperation,
 )
-from data_processing.src.helpers import print_time_duration
+from data_processing.src.helpers import print_time_duration, run_concurrently
 from data_processing.settings import configure_logging
 
 
 logger = logging.getLogger(__name__)
 
 
-class TotalTherapistSynchronizer:
-
-    def __init__(self) -> None:
-        self.operation = TotalTherapistBackendOperation()
+def _run_phase(phase: Callable, period_type: str) -> None:
+    """
+    Runs that given sync back `phase` for that `period_type`.
+    """
+    phase(period_type)
 
-        self._sync_back_org_weekly_data()
-        self._sync_back_org_monthly_data()
-        self._sync_back_org_yearly_data()
 
-        self._sync_back_nd_alltime_data()
-        self._sync_back_nd_weekly_data()
-        self._sync_back_nd_monthly_data()
-        self._sync_back_nd_yearly_data()
-
-    def _sync_back_org_weekly_data(self) -> None:
-        """
-        Synchronize weekly total therapists in the Organization
-        back to the Backend service.
-        """
+def _run_synchronizer(synchronizer: Type) -> None:
+    """
+    Runs that given `synchronizer` class, it syncs back its data on initialization.
+    """
+    synchronizer()
 
-        total_thers_map = self.operation.get_org_weekly_therapists_map()
 
-        for org_id, total_thers in total_thers_map.items():
-            self.operation.upsert_by_org(org_id, total_thers)
-
-    def _sync_back_org_monthly_data(self) -> None:
-        """
-        Synchronize monthly total therapists in the Organization
-        back to the Backend service.
-        """
-
-        total_thers_map = self.operation.get_org_monthly_therapists_map()
+class TotalTherapistSynchronizer:
 
-        for org_id, total_thers in total_thers_map.items():
-            self.operation.upsert_by_org(org_id, total_thers)
+    ORG_PERIOD_TYPES = ['weekly', 'monthly', 'yearly']
+    ND_PERIOD_TYPES = ['alltime', 'weekly', 'monthly', 'yearly']
 
-    def _sync_back_org_yearly_data(self) -> None:
-        """
-        Synchronize yearly total therapists in the Organization
-        back to the Backend service.
-        """
+    def __init__(self) -> None:
+        self.operation = TotalTherapistBackendOperation()
 
-        total_thers_map = self.operation.get_org_yearly_therapists_map()
+        # Every phase reads its own file and upserts different records,
+        # therefore we can run all of them concurrently.
+        phases = (
+            [(self._sync_back_org_data, period_type) for period_type in self.ORG_PERIOD_TYPES] +
+            [(self._sync_back_nd_data, period_type) for period_type in self.ND_PERIOD_TYPES]
+        )
 
-        for org_id, total_thers in total_thers_map.items():
-            self.operation.upsert_by_org(org_id, total_thers)
+        run_concurrently(
+            _run_phase,
+            [phase for phase, _ in phases],
+            [period_type for _, period_type in phases],
+            max_workers=len(phases)
+        )
 
-    def _sync_back_nd_alltime_data(self) -> None:
+    def _sync_back_org_data(self, period_type: str) -> None:
         """
-        Synchronize the total all therapists in NiceDay
+        Synchronize total therapists in the Organization on that `period_type`
         back to the Backend service.
         """
 
-        total_thers = self.operation.get_nd_alltime_therapists()
-        self.operation.upsert(total_thers)
-
-    def _sync_back_nd_weekly_data(self) -> None:
-        """
-        Synchronize weekly total therapists in NiceDay
-        back to the Backend service.
-        """
+        total_thers_map = self.operation.get_org_therapists_map(period_type)
 
-        total_thers = self.operation.get_nd_weekly_therapists()
-        self.operation.upsert(total_thers)
+        self.operation.upsert_by_orgs(total_thers_map)
 
-    def _sync_back_nd_monthly_data(self) -> None:
+    def _sync_back_nd_data(self, period_type: str) -> None:
         """
-        Synchronize monthly total therapists in NiceDay
+        Synchronize total therapists in NiceDay on that `period_type`
         back to the Backend service.
         """
 
-        total_thers = self.operation.get_nd_monthly_therapists()
-        self.operation.upsert(total_thers)
-
-    def _sync_back_nd_yearly_data(self) -> None:
-        """
-        Synchronize yearly total therapists in NiceDay
-        back to the Backend service.
-        """
-
-        total_thers = self.operation.get_nd_yearly_therapists()
+        total_thers = self.operation.get_nd_therapists(period_type)
         self.operation.upsert(total_thers)
 
 
 class TherapistRateSynchronizer:
 
+    ORG_PERIOD_TYPES = ['weekly', 'monthly', 'yearly']
+    ND_PERIOD_TYPES = ['weekly', 'monthly', 'yearly']
+
     def __init__(self) -> None:
         self.operation = TherapistRateBackendOperation()
 
-        self._sync_back_org_weekly_data()
-        self._sync_back_org_monthly_data()
-        self._sync_back_org_yearly_data()
-
-        self._sync_back_nd_weekly_data()
-        self._sync_back_nd_monthly_data()
-        self._sync_back_nd_yearly_data()
-
-    def _sync_back_org_weekly_data(self) -> None:
-        """
-        Synchronize weekly therapists' rates in the Organization
-        back to the Backend service.
-        """
-
-        rates_map = self.operation.get_org_weekly_rates_map()
-
-        for org_id, rates in rates_map.items():
-            self.operation.upsert_by_org(org_id, rates)
-
-    def _sync_back_org_monthly_data(self) -> None:
-        """
-        Synchronize monthly therapists' rates in the Organization
-        back to the Backend service.
-        """
-
-        rates_map = self.operation.get_org_monthly_rates_map()
-
-        for org_id, rates in rates_map.items():
-            self.operation.upsert_by_org(org_id, rates)
-
-    def _sync_back_org_yearly_data(self) -> None:
-        """
-        Synchronize yearly therapists' rates in the Organization
-        back to the Backend service.
-        """
-
-        rates_map = self.operation.get_org_yearly_rates_map()
+        # Every phase reads its own file and upserts different records,
+        # therefore we can run all of them concurrently.
+        phases = (
+            [(self._sync_back_org_data, period_type) for period_type in self.ORG_PERIOD_TYPES] +
+            [(self._sync_back_nd_data, period_type) for period_type in self.ND_PERIOD_TYPES]
+        )
 
-        for org_id, rates in rates_map.items():
-            self.operation.upsert_by_org(org_id, rates)
+        run_concurrently(
+            _run_phase,
+            [phase for phase, _ in phases],
+            [period_type for _, period_type in phases],
+            max_workers=len(phases)
+        )
 
-    def _sync_back_nd_weekly_data(self) -> None:
+    def _sync_back_org_data(self, period_type: str) -> None:
         """
-        Synchronize weekly therapists' rates in NiceDay
+        Synchronize therapists' rates in the Organization on that `period_type`
         back to the Backend service.
         """
 
-        rates = self.operation.get_nd_weekly_rates()
-        self.operation.upsert(rates)
+        rates_map = self.operation.get_org_rates_map(period_type)
 
-    def _sync_back_nd_monthly_data(self) -> None:
-        """
-        Synchronize monthly therapists' rates in NiceDay
-        back to the Backend service.
-        """
+        self.operation.upsert_by_orgs(rates_map)
 
-        rates = self.operation.get_nd_monthly_rates()
-        self.operation.upsert(rates)
-
-    def _sync_back_nd_yearly_data(self) -> None:
+    def _sync_back_nd_data(self, period_type: str) -> None:
         """
-        Synchronize yearly therapists' rates in NiceDay
+        Synchronize therapists' rates in NiceDay on that `period_type`
         back to the Backend service.
         """
 
-        rates = self.operation.get_nd_yearly_rates()
+        rates = self.operation.get_nd_rates(period_type)
         self.operation.upsert(rates)
 
 
@@ -177,8 +118,11 @@ if __name__ == '__main__':
     # Runs sync back operation
     process_start_at = datetime.now()
 
-    TotalTherapistSynchronizer()
-    TherapistRateSynchronizer()
+    # Both synchronizers read different files and upsert to different endpoints,
+    # therefore we can run them concurrently.
+    synchronizers = [TotalTherapistSynchronizer, TherapistRateSynchronizer]
+
+    run_concurrently(_run_synchronizer, synchronizers, max_workers=len(synchronizers))
 
     process_end_at = datetime.now()
     tag = "Sync back total therapists and therapists' rates"
@@ -57,8 +57,7 @@ class DataVisualization:
         base_path = path.abspath(path.dirname(path.dirname(__name__)))
         outputs_path = f'{base_path}/visualization/{directory}'
 
-        if not path.exists(outputs_path):
-            makedirs(outputs_path)
+        makedirs(outputs_path, exist_ok=True)
 
         # Saves the plot as PNG file
         filename = title.replace('\n', ' ').replace('/', ' or ')